@@ -10,13 +10,105 @@ bl_info = {
 
 import bpy
 import os
+import sys
 import bmesh
-from mathutils import Vector, Color, Quaternion
+import numpy as np
+from contextlib import contextmanager, nullcontext
+from mathutils import Vector, Quaternion
 from bpy.props import (
     StringProperty, BoolProperty, FloatProperty, EnumProperty,
     PointerProperty, CollectionProperty, FloatVectorProperty, IntProperty
 )
 from bpy.types import Operator, Panel, PropertyGroup, Material
+from bpy.app.handlers import persistent
+
+# -----------------------------
+# Helpers
+# -----------------------------
+# Exact-case filename matches are only meaningful on case-sensitive filesystems
+_CASE_SENSITIVE_FS = sys.platform.startswith("linux")
+
+# Object Mode for the with block, back to Edit Mode even on early return
+@contextmanager
+def _object_mode():
+    bpy.ops.object.mode_set(mode='OBJECT')
+    try:
+        yield
+    finally:
+        bpy.ops.object.mode_set(mode='EDIT')
+
+def _vertex_selection(mesh):
+    sel = np.empty(len(mesh.vertices), dtype=bool)
+    mesh.vertices.foreach_get("select", sel)
+    return sel
+
+def _loop_vertex_indices(mesh):
+    vidx = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", vidx)
+    return vidx
+
+# Vertex selection mapped onto a POINT or CORNER color attribute's elements
+def _color_element_mask(col_attr, mesh, vsel):
+    if col_attr.domain == 'POINT':
+        return vsel
+    return vsel[_loop_vertex_indices(mesh)]
+
+# os.path.splitext(name)[0]; plain rfind is enough unless the name starts with
+# a dot, where splitext doesn't treat leading dots as an extension separator
+def _stem(name):
+    if name[:1] != '.':
+        dot = name.rfind('.')
+        return name[:dot] if dot > 0 else name
+    return os.path.splitext(name)[0]
+
+# Folder listings from earlier texture searches: path -> (mtime_ns, files, subfolders).
+# A folder's mtime changes whenever an entry in it is added, removed or renamed,
+# so unchanged folders are not re-read on the next search.
+_dir_cache = {}
+
+@persistent
+def _clear_dir_cache(*_args):
+    _dir_cache.clear()
+
+# (name, path) for every file below root. DirEntry types are cached, so no
+# per-file stat(); symlinked folders are not followed, unreadable ones skipped.
+def _iter_files(root):
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            mtime = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            continue
+        listing = _dir_cache.get(dirpath)
+        if listing is None or listing[0] != mtime:
+            files = []
+            subdirs = []
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file():
+                            files.append((entry.name, entry.path))
+            except OSError:
+                continue
+            listing = _dir_cache[dirpath] = (mtime, files, subdirs)
+        # Reversed so siblings pop in listing order, matching os.walk's pre-order
+        stack.extend(reversed(listing[2]))
+        yield from listing[1]
+
+# Top-most parent of obj; every object on the way is memoized in cache
+def _find_root(obj, cache):
+    path = []
+    node = obj
+    while node not in cache and node.parent:
+        path.append(node)
+        node = node.parent
+    root = cache.get(node, node)
+    for n in path:
+        cache[n] = root
+    return root
 
 # -----------------------------
 # Settings
@@ -28,18 +120,66 @@ class NENOORE_Settings(PropertyGroup):
     # Material Utilities
     material_to_copy: PointerProperty(name="Material to Copy", type=bpy.types.Material)
 
+# -----------------------------
+# Text formats
+# -----------------------------
+# Bound str.format templates shared by the clipboard operators and cached labels
+_FMT3 = "{:.6f}, {:.6f}, {:.6f}".format
+_FMT4 = "{:.6f}, {:.6f}, {:.6f}, {:.6f}".format
+_XML = (
+    '  <position x="{:.6f}" y="{:.6f}" z="{:.6f}" />\n'
+    '  <rotation x="{:.6f}" y="{:.6f}" z="{:.6f}" w="{:.6f}" />'
+).format
+
+# -----------------------------
+# Cached labels
+# -----------------------------
+# Panels redraw constantly, so coordinate text is formatted when a value is
+# stored rather than in draw(); the copy operators reuse the same strings.
+# Empty caches (e.g. older .blend files) fall back to formatting on the fly.
+def _coord_label(co):
+    return _FMT3(*co)
+
+def _gta_order(quat):
+    # Blender stores w, x, y, z; YMAPs want x, y, z, w
+    w, x, y, z = quat
+    return x, y, z, w
+
+def _rotation_gta(props):
+    # Files saved before rotation_gta existed only have rotation
+    if props.is_property_set("rotation_gta"):
+        return props.rotation_gta
+    return _gta_order(props.rotation)
+
+def _update_portal_label(self, context):
+    self.label_cached = _coord_label(self.coord)
+
+def _update_position_label(self, context):
+    self.position_label = _coord_label(self.position)
+
+def _update_rotation(self, context):
+    self.rotation_gta = _gta_order(self.rotation)
+
+def _update_rotation_label(self, context):
+    self.rotation_label = _FMT4(*self.rotation_gta)
+
 # -----------------------------
 # Portal item
 # -----------------------------
 class NENOORE_PortalCoord(PropertyGroup):
-    coord: FloatVectorProperty(size=3, default=(0.0,0.0,0.0))
+    coord: FloatVectorProperty(size=3, default=(0.0,0.0,0.0), update=_update_portal_label)
+    label_cached: StringProperty(options={'HIDDEN'})
 
 # -----------------------------
 # Ymap props
 # -----------------------------
 class NENOORE_YmapProps(PropertyGroup):
-    position: FloatVectorProperty(name="Position", size=3, default=(0.0, 0.0, 0.0), precision=6)
-    rotation: FloatVectorProperty(name="Rotation", size=4, default=(0.0, 0.0, 0.0, 1.0), precision=6)
+    position: FloatVectorProperty(name="Position", size=3, default=(0.0, 0.0, 0.0), precision=6, update=_update_position_label)
+    rotation: FloatVectorProperty(name="Rotation", size=4, default=(0.0, 0.0, 0.0, 1.0), precision=6, update=_update_rotation)
+    # Same rotation in the x, y, z, w order YMAPs use, kept in sync by rotation's update
+    rotation_gta: FloatVectorProperty(name="Rotation (GTA)", size=4, default=(0.0, 0.0, 0.0, 1.0), precision=6, update=_update_rotation_label)
+    position_label: StringProperty(options={'HIDDEN'})
+    rotation_label: StringProperty(options={'HIDDEN'})
 
 
 # -----------------------------
@@ -52,74 +192,62 @@ class NENOORE_OT_prepare_vanilla(Operator):
     remove_parent: BoolProperty(default=False)
 
     def execute(self, context):
-        prepared = 0
-        sel = context.selected_objects[:]
+        # Filter once; the set lets the hierarchy scan keep every selected mesh.
+        # Bpy wrappers are recreated on access, so membership uses ==/hash, not id().
+        sel = [o for o in context.selected_objects if o.type == 'MESH']
         if not sel:
-            self.report({'WARNING'}, "Select at least one object")
+            self.report({'WARNING'}, "Select at least one mesh object")
             return {'CANCELLED'}
+        keep = set(sel)
+
+        # Find the top-most parents before any parent is cleared; selected objects
+        # often share a hierarchy, so roots are remembered once found.
+        parents_to_remove = []
+        if self.remove_parent:
+            root_of = {}
+            parents_to_remove = [_find_root(obj, root_of) for obj in sel]
 
         for obj in sel:
-            if obj.type != 'MESH':
-                continue
-            
-            # Find the top-most parent of the selected object.
-            parent_to_remove = obj
-            while parent_to_remove.parent:
-                parent_to_remove = parent_to_remove.parent
-
-            # Clear parent while keeping transform
-            obj.select_set(True)
-            context.view_layer.objects.active = obj
-            try:
-                bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
-            except Exception:
-                pass
+            # Clear parent while keeping transform (same as CLEAR_KEEP_TRANSFORM,
+            # without an operator call and depsgraph update per object)
+            if obj.parent:
+                matrix = obj.matrix_world.copy()
+                obj.parent = None
+                obj.matrix_world = matrix
 
             # Rename mesh data to object name
             if obj.data:
                 obj.data.name = obj.name
 
-            if self.remove_parent and parent_to_remove:
-                # Store the name of the top-most parent.
-                parent_name = parent_to_remove.name
-                
-                # We need to collect a list of objects to delete first,
-                # as deleting them during iteration can cause the reference error.
-                objects_to_delete = []
-                
-                for scene_obj in bpy.data.objects:
-                    is_child_to_remove = False
-                    parent_path = scene_obj
-                    
-                    # Traverse the parent chain of the current scene object.
-                    while parent_path:
-                        if parent_path.name == parent_name:
-                            is_child_to_remove = True
-                            break
-                        parent_path = parent_path.parent
-                    
-                    # If it's part of the hierarchy and not the object we want to keep, add it to the list.
-                    if is_child_to_remove and scene_obj.name != obj.name:
-                        objects_to_delete.append(scene_obj)
-                
-                # Now, perform the deletion.
-                for obj_to_delete in objects_to_delete:
-                    try:
-                        bpy.data.objects.remove(obj_to_delete, do_unlink=True)
-                    except Exception as e:
-                        # Log the error for debugging
-                        print(f"Error removing object {obj_to_delete.name}: {e}")
-                
-                # Finally, delete the top-most parent itself.
-                if parent_name in bpy.data.objects:
-                    try:
-                        bpy.data.objects.remove(bpy.data.objects[parent_name], do_unlink=True)
-                    except Exception as e:
-                        print(f"Error removing parent {parent_name}: {e}")
-            
-            prepared += 1
-
-        self.report({'INFO'}, f"Prepared {prepared} objects")
+        # Every selected mesh is unparented before anything is deleted, so a
+        # kept object never loses its parent (and transform) mid-way.
+        if self.remove_parent:
+            # Map every object to its direct children once, so removing a hierarchy
+            # is a walk down from its root instead of a parent-chain scan per object.
+            children = {}
+            for scene_obj in bpy.data.objects:
+                children.setdefault(scene_obj.parent, []).append(scene_obj)
+
+            # Everything from the top-most parents down goes, except the objects we keep.
+            # Selected meshes usually share an archetype; walk each shared tree once.
+            objects_to_delete = set()
+            for parent_to_remove in dict.fromkeys(parents_to_remove):
+                stack = [parent_to_remove]
+                while stack:
+                    node = stack.pop()
+                    if node not in keep:
+                        objects_to_delete.add(node)
+                    stack.extend(children.get(node, ()))
+
+            # Delete the hierarchies in one call; per-object removal rebuilds ID users each time.
+            try:
+                bpy.data.batch_remove(ids=list(objects_to_delete))
+            except Exception as e:
+                # Log the error for debugging
+                print(f"Error removing parent hierarchies: {e}")
+
+        context.view_layer.update()
+        self.report({'INFO'}, f"Prepared {len(sel)} objects")
         return {'FINISHED'}
 
 
@@ -157,52 +285,80 @@ class NENOORE_OT_find_missing_files_recursive(Operator):
             print(f"Built-in find_missing_files failed or raised: {e}")
 
         # Now check for still-missing images and try manual relinking
-        missing_images = [
-            img for img in bpy.data.images
-            if img.filepath and (not img.packed_file) and not os.path.exists(bpy.path.abspath(img.filepath))
-        ]
+        # Cheap checks first so packed/unset images never hit path resolution or stat
+        # Blend-relative '//' paths are resolved in Python, which is what
+        # bpy.path.abspath/relpath do, minus the round-trip per image.
+        blend_dir = os.path.dirname(bpy.data.filepath)
+        missing_images = []
+        for img in bpy.data.images:
+            fp = img.filepath
+            if not fp or img.packed_file:
+                continue
+            abs_path = os.path.join(blend_dir, fp[2:]) if fp.startswith("//") else fp
+            if not os.path.exists(abs_path):
+                missing_images.append((img, os.path.basename(abs_path)))
 
         if not missing_images:
             self.report({'INFO'}, "No missing files to find (or built-in relink succeeded).")
             return {'FINISHED'}
 
+        # Only the names we are missing are worth indexing; once every one of them
+        # has been found the rest of the tree can be skipped. On case-sensitive
+        # filesystems an exact-case file deeper down still beats a wrong-case one
+        # already found, so the walk also waits for those.
+        # A name leaves its set once stored, so later duplicates are skipped.
+        remaining = {filename.lower() for _, filename in missing_images}
+        needed_stems = {_stem(name) for name in remaining}
+        needed_exact = {filename for _, filename in missing_images}
+
         # Build a map of filenames -> path (case-insensitive) in the search_dir
+        # stem_map indexes the same files by name without extension for the fallback,
+        # exact_map by their real-case name, preferred on case-sensitive filesystems.
         file_map = {}
-        for dirpath, _, filenames in os.walk(search_dir):
-            for filename in filenames:
-                key = filename.lower()
-                # prefer first found instance for duplicates
-                if key not in file_map:
-                    file_map[key] = os.path.join(dirpath, filename)
+        stem_map = {}
+        exact_map = {}
+        for name, path in _iter_files(search_dir):
+            # prefer first found instance for duplicates
+            key = name.lower()
+            if key in remaining:
+                remaining.remove(key)
+                file_map[key] = path
+            stem = _stem(key)
+            if stem in needed_stems:
+                needed_stems.remove(stem)
+                stem_map[stem] = path
+            if _CASE_SENSITIVE_FS and name in needed_exact:
+                needed_exact.remove(name)
+                exact_map[name] = path
+            if not remaining and not (_CASE_SENSITIVE_FS and needed_exact):
+                break
 
         relinked_count = 0
+        to_reload = []
 
         # Try to relink each missing image by filename
-        for image in missing_images:
-            try:
-                raw_path = image.filepath_raw if hasattr(image, "filepath_raw") else image.filepath
-                missing_filename = os.path.basename(raw_path).lower()
-            except Exception:
-                missing_filename = os.path.basename(image.filepath).lower()
+        for image, filename in missing_images:
+            missing_filename = filename.lower()
 
-            candidate = file_map.get(missing_filename)
+            # Exact name first; only then fall back to the case-insensitive match
+            candidate = exact_map.get(filename) or file_map.get(missing_filename)
 
             # Fallback: match by name without extension
             if not candidate:
-                name_no_ext = os.path.splitext(missing_filename)[0]
-                for key, path in file_map.items():
-                    if os.path.splitext(key)[0] == name_no_ext:
-                        candidate = path
-                        break
+                candidate = stem_map.get(_stem(missing_filename))
 
             # If found, relink
             if candidate:
                 try:
                     # Use relative path if possible (blend dir), else absolute
-                    try:
-                        relp = bpy.path.relpath(candidate)
-                    except Exception:
-                        relp = candidate
+                    # (relative paths need a saved blend file to be relative to)
+                    relp = candidate
+                    if blend_dir:
+                        try:
+                            relp = "//" + os.path.relpath(candidate, blend_dir)
+                        except ValueError:
+                            # e.g. a different drive on Windows
+                            pass
 
                     # If relp startswith '//', blender will make it relative
                     if relp.startswith("//"):
@@ -210,14 +366,22 @@ class NENOORE_OT_find_missing_files_recursive(Operator):
                     else:
                         image.filepath = candidate
 
-                    # Force reload to pick up the new file
-                    image.reload()
+                    # Orphaned images pick the new path up whenever they are next used
+                    if image.users:
+                        to_reload.append(image)
                     relinked_count += 1
                     print(f"Relinked '{image.name}' -> '{candidate}'")
                 except Exception as e:
                     print(f"Failed to relink '{image.name}' to '{candidate}': {e}")
                     continue
 
+        # Force reload to pick up the new files, once every path has been assigned
+        for image in to_reload:
+            try:
+                image.reload()
+            except RuntimeError as e:
+                print(f"Failed to reload '{image.name}': {e}")
+
         if relinked_count > 0:
             self.report({'INFO'}, f"Successfully relinked {relinked_count} of {len(missing_images)} missing files.")
         else:
@@ -230,6 +394,17 @@ class NENOORE_OT_find_missing_files_recursive(Operator):
         return {'RUNNING_MODAL'}
 
 
+class NENOORE_OT_clear_texture_search_cache(Operator):
+    bl_idname = "nenoore.clear_texture_search_cache"
+    bl_label = "Force Rescan"
+    bl_description = "Forget remembered folder listings so the next search reads every folder again"
+
+    def execute(self, context):
+        _dir_cache.clear()
+        self.report({'INFO'}, "Texture search cache cleared")
+        return {'FINISHED'}
+
+
 # -----------------------------
 # Operators: Vertex Color Pick / Apply
 # -----------------------------
@@ -244,49 +419,41 @@ class NENOORE_OT_pick_vertex_color(Operator):
             self.report({'ERROR'}, "Select a mesh object")
             return {'CANCELLED'}
 
-        if obj.mode == 'EDIT':
-            bm = bmesh.from_edit_mesh(obj.data)
-        else:
-            bm = bmesh.new()
-            bm.from_mesh(obj.data)
-
-        if not bm.loops.layers.color:
-            if obj.mode != 'EDIT':
-                bm.free()
-            self.report({'ERROR'}, "Mesh has no vertex color layer")
-            return {'CANCELLED'}
-        color_layer = bm.loops.layers.color.active
-
-        sel_verts = [v for v in bm.verts if v.select]
-        if not sel_verts:
-            if obj.mode != 'EDIT':
-                bm.free()
+        in_edit = obj.mode == 'EDIT'
+        # total_vert_sel is a cached count in Edit Mode (always 0 outside it)
+        if in_edit and not obj.data.total_vert_sel:
             self.report({'ERROR'}, "Select one or more vertices")
             return {'CANCELLED'}
 
-        sumcol = Color((0.0,0.0,0.0))
-        count = 0
-        for v in sel_verts:
-            for l in v.link_loops:
-                col = l[color_layer]
-                sumcol.r += col[0]; sumcol.g += col[1]; sumcol.b += col[2]
-                count += 1
-
-        if count == 0:
-            if obj.mode != 'EDIT':
-                bm.free()
-            self.report({'ERROR'}, "Selected vertices don't have loop colors")
-            return {'CANCELLED'}
-
-        avg = Color((sumcol.r/count, sumcol.g/count, sumcol.b/count))
-        context.scene.nenoore_settings.picked_color = (avg.r, avg.g, avg.b)
+        # Color attribute data reads as empty in Edit Mode, so leave it for the reads
+        with _object_mode() if in_edit else nullcontext():
+            mesh = obj.data
+            col_attr = mesh.color_attributes.active_color
+            if col_attr is None:
+                self.report({'ERROR'}, "Mesh has no vertex color layer")
+                return {'CANCELLED'}
+
+            vsel = _vertex_selection(mesh)
+            if not vsel.any():
+                self.report({'ERROR'}, "Select one or more vertices")
+                return {'CANCELLED'}
+
+            elem_sel = _color_element_mask(col_attr, mesh, vsel)
+            if not elem_sel.any():
+                self.report({'ERROR'}, "Selected vertices don't have loop colors")
+                return {'CANCELLED'}
+
+            cols = np.empty(len(col_attr.data) * 4, dtype=np.float32)
+            col_attr.data.foreach_get("color_srgb", cols)
+            # Masked sum in place; fancy indexing would copy every selected row first
+            total = cols.reshape(-1, 4)[:, :3].sum(axis=0, dtype=np.float64, where=elem_sel[:, None])
+        context.scene.nenoore_settings.picked_color = (total / np.count_nonzero(elem_sel)).tolist()
 
         pr, pg, pb = context.scene.nenoore_settings.picked_color
-        hexv = "#{:02X}{:02X}{:02X}".format(int(pr*255), int(pg*255), int(pb*255))
+        rgb = bytes(min(255, max(0, int(c*255))) for c in (pr, pg, pb))
+        hexv = "#" + rgb.hex().upper()
         context.window_manager.clipboard = hexv
 
-        if obj.mode != 'EDIT':
-            bm.free()
         self.report({'INFO'}, f"Picked color and copied hex: {hexv}")
         return {'FINISHED'}
 
@@ -304,27 +471,37 @@ class NENOORE_OT_apply_picked_color(Operator):
             self.report({'ERROR'}, "Switch to Edit Mode to apply color")
             return {'CANCELLED'}
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        color_layer = bm.loops.layers.color.active
-        if not color_layer:
-            color_layer = bm.loops.layers.color.new("Col")
-
         picked = context.scene.nenoore_settings.picked_color
         if not picked:
             self.report({'ERROR'}, "No picked color stored")
             return {'CANCELLED'}
         pr, pg, pb = picked[0], picked[1], picked[2]
 
-        sel_verts = [v for v in bm.verts if v.select]
-        if not sel_verts:
+        if not obj.data.total_vert_sel:
             self.report({'ERROR'}, "Select one or more vertices to apply color")
             return {'CANCELLED'}
 
-        for v in sel_verts:
-            for l in v.link_loops:
-                l[color_layer] = (pr, pg, pb, 1.0)
+        # Leave Edit Mode briefly so the whole color layer can be written in one call
+        with _object_mode():
+            mesh = obj.data
+            vsel = _vertex_selection(mesh)
+
+            col_attr = mesh.color_attributes.active_color
+            if col_attr is None:
+                # Same kind of layer bmesh creates: byte colors per face corner
+                col_attr = mesh.color_attributes.new(name="Col", type='BYTE_COLOR', domain='CORNER')
+                mesh.color_attributes.active_color = col_attr
+                # Unpainted corners start out white, as in a new bmesh color layer
+                cols = np.ones(len(col_attr.data) * 4, dtype=np.float32)
+            else:
+                cols = np.empty(len(col_attr.data) * 4, dtype=np.float32)
+                col_attr.data.foreach_get("color_srgb", cols)
+
+            cols = cols.reshape(-1, 4)
+            cols[_color_element_mask(col_attr, mesh, vsel)] = (pr, pg, pb, 1.0)
+            col_attr.data.foreach_set("color_srgb", cols.ravel())
+            mesh.update()
 
-        bmesh.update_edit_mesh(obj.data)
         self.report({'INFO'}, "Applied picked color to selected vertices")
         return {'FINISHED'}
 
@@ -413,29 +590,36 @@ class NENOORE_OT_apply_material(Operator):
             self.report({'ERROR'}, "No material has been copied yet")
             return {'CANCELLED'}
         
-        bm = bmesh.from_edit_mesh(obj.data)
-        selected_faces = [f for f in bm.faces if f.select]
-
+        # Edit Mode count, no mode switch needed to check it
+        selected_faces = obj.data.total_face_sel
         if not selected_faces:
             self.report({'ERROR'}, "Select at least one face to apply the material")
-            bm.free()
             return {'CANCELLED'}
-        
-        material_index = -1
-        for i, slot in enumerate(obj.material_slots):
-            if slot.material == material_to_apply:
-                material_index = i
-                break
-        
-        if material_index == -1:
-            obj.data.materials.append(material_to_apply)
-            material_index = len(obj.material_slots) - 1
-
-        for face in selected_faces:
-            face.material_index = material_index
 
-        bmesh.update_edit_mesh(obj.data)
-        self.report({'INFO'}, f"Applied material '{material_to_apply.name}' to {len(selected_faces)} faces")
+        # Leave Edit Mode briefly so face indices can be written in one call
+        with _object_mode():
+            mesh = obj.data
+            face_sel = np.empty(len(mesh.polygons), dtype=bool)
+            mesh.polygons.foreach_get("select", face_sel)
+
+            # First slot holding the material wins, as with a linear scan; empty slots never match
+            slot_index = {}
+            for i, slot in enumerate(obj.material_slots):
+                if slot.material:
+                    slot_index.setdefault(slot.material, i)
+            material_index = slot_index.get(material_to_apply, -1)
+
+            if material_index == -1:
+                obj.data.materials.append(material_to_apply)
+                material_index = len(obj.material_slots) - 1
+
+            mat_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("material_index", mat_indices)
+            mat_indices[face_sel] = material_index
+            mesh.polygons.foreach_set("material_index", mat_indices)
+            mesh.update()
+
+        self.report({'INFO'}, f"Applied material '{material_to_apply.name}' to {selected_faces} faces")
         return {'FINISHED'}
 
 
@@ -456,20 +640,21 @@ class NENOORE_OT_add_portal_vertex(Operator):
             self.report({'ERROR'}, "Enter Edit Mode and select one vertex at a time")
             return {'CANCELLED'}
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        sel_verts = [v for v in bm.verts if v.select]
-        if len(sel_verts) != 1:
+        # Cached Edit Mode count; only scan for the vertex once we know there is exactly one
+        if obj.data.total_vert_sel != 1:
             self.report({'ERROR'}, "Select exactly one vertex at a time")
             return {'CANCELLED'}
 
-        v = sel_verts[0]
-        world_coord = obj.matrix_world @ v.co
         scene = context.scene
         coords = scene.nenoore_portal_coords
         if len(coords) >= 4:
             self.report({'WARNING'}, "Already have 4 vertices stored; reset first")
             return {'CANCELLED'}
 
+        bm = bmesh.from_edit_mesh(obj.data)
+        v = next(v for v in bm.verts if v.select)
+        world_coord = obj.matrix_world @ v.co
+
         item = coords.add()
         item.coord = (world_coord.x, world_coord.y, world_coord.z)
         self.report({'INFO'}, f"Stored vertex {len(coords)}")
@@ -498,9 +683,8 @@ class NENOORE_OT_copy_single_coord(Operator):
         if self.index < 0 or self.index >= len(coords):
             self.report({'ERROR'}, "Invalid index")
             return {'CANCELLED'}
-        x, y, z = coords[self.index].coord
-        line = f"{x:.6f}, {y:.6f}, {z:.6f}"
-        context.window_manager.clipboard = line
+        item = coords[self.index]
+        context.window_manager.clipboard = item.label_cached or _coord_label(item.coord)
         self.report({'INFO'}, "Copied coordinate")
         return {'FINISHED'}
 
@@ -514,12 +698,9 @@ class NENOORE_OT_copy_all_coords(Operator):
         if len(coords) != 4:
             self.report({'ERROR'}, "Need exactly 4 coords to copy all")
             return {'CANCELLED'}
-        lines = []
-        for item in coords:
-            x, y, z = item.coord
-            lines.append(f"{x:.6f}, {y:.6f}, {z:.6f}")
-        text = "\n".join(lines)
-        context.window_manager.clipboard = text
+        context.window_manager.clipboard = "\n".join(
+            item.label_cached or _coord_label(item.coord) for item in coords
+        )
         self.report({'INFO'}, "Copied all portal coordinates")
         return {'FINISHED'}
 
@@ -555,9 +736,7 @@ class NENOORE_OT_copy_ymap_position(Operator):
 
     def execute(self, context):
         ymap_props = context.scene.nenoore_ymap_props
-        x, y, z = ymap_props.position
-        line = f"{x:.6f}, {y:.6f}, {z:.6f}"
-        context.window_manager.clipboard = line
+        context.window_manager.clipboard = ymap_props.position_label or _coord_label(ymap_props.position)
         self.report({'INFO'}, "Copied position")
         return {'FINISHED'}
 
@@ -568,9 +747,7 @@ class NENOORE_OT_copy_ymap_rotation(Operator):
 
     def execute(self, context):
         ymap_props = context.scene.nenoore_ymap_props
-        x, y, z, w = ymap_props.rotation[1], ymap_props.rotation[2], ymap_props.rotation[3], ymap_props.rotation[0]
-        line = f"{x:.6f}, {y:.6f}, {z:.6f}, {w:.6f}"
-        context.window_manager.clipboard = line
+        context.window_manager.clipboard = ymap_props.rotation_label or _FMT4(*_rotation_gta(ymap_props))
         self.report({'INFO'}, "Copied rotation")
         return {'FINISHED'}
 
@@ -581,14 +758,7 @@ class NENOORE_OT_copy_ymap_xml(Operator):
 
     def execute(self, context):
         ymap_props = context.scene.nenoore_ymap_props
-        pos_x, pos_y, pos_z = ymap_props.position
-        rot_x, rot_y, rot_z, rot_w = ymap_props.rotation[1], ymap_props.rotation[2], ymap_props.rotation[3], ymap_props.rotation[0]
-        
-        xml_string = (
-            f'  <position x="{pos_x:.6f}" y="{pos_y:.6f}" z="{pos_z:.6f}" />\n'
-            f'  <rotation x="{rot_x:.6f}" y="{rot_y:.6f}" z="{rot_z:.6f}" w="{rot_w:.6f}" />'
-        )
-        context.window_manager.clipboard = xml_string
+        context.window_manager.clipboard = _XML(*ymap_props.position, *_rotation_gta(ymap_props))
         self.report({'INFO'}, "Copied YMAP XML to clipboard")
         return {'FINISHED'}
 
@@ -664,6 +834,7 @@ class NENOORE_PT_turbo_texture_finder(Panel):
     def draw(self, context):
         layout = self.layout
         layout.operator("nenoore.find_missing_files_recursive", icon='FILE_FOLDER')
+        layout.operator("nenoore.clear_texture_search_cache", icon='FILE_REFRESH')
 
 
 class NENOORE_PT_vertex_color(Panel):
@@ -711,7 +882,7 @@ class NENOORE_PT_portal(Panel):
         
         for i, item in enumerate(coords):
             row = layout.row(align=True)
-            row.label(text=f"{item.coord[0]:.6f}, {item.coord[1]:.6f}, {item.coord[2]:.6f}")
+            row.label(text=item.label_cached or _coord_label(item.coord))
             op = row.operator("nenoore.copy_single_coord", text="", icon='COPYDOWN')
             op.index = i
 
@@ -744,13 +915,11 @@ class NENOORE_PT_ymap(Panel):
         col = box.column(align=True)
         
         row = col.row(align=True)
-        pos_x, pos_y, pos_z = ymap_props.position
-        row.label(text=f"position: {pos_x:.6f}, {pos_y:.6f}, {pos_z:.6f}")
+        row.label(text="position: " + (ymap_props.position_label or _coord_label(ymap_props.position)))
         row.operator("nenoore.copy_ymap_position", text="", icon='COPYDOWN')
 
         row = col.row(align=True)
-        rot_x, rot_y, rot_z, rot_w = ymap_props.rotation[1], ymap_props.rotation[2], ymap_props.rotation[3], ymap_props.rotation[0]
-        row.label(text=f"rotation: {rot_x:.6f}, {rot_y:.6f}, {rot_z:.6f}, {rot_w:.6f}")
+        row.label(text="rotation: " + (ymap_props.rotation_label or _FMT4(*_rotation_gta(ymap_props))))
         row.operator("nenoore.copy_ymap_rotation", text="", icon='COPYDOWN')
         
         layout.separator()
@@ -766,6 +935,7 @@ classes = (
     NENOORE_YmapProps,
     NENOORE_OT_prepare_vanilla,
     NENOORE_OT_find_missing_files_recursive,
+    NENOORE_OT_clear_texture_search_cache,
     NENOORE_OT_pick_vertex_color,
     NENOORE_OT_apply_picked_color,
     NENOORE_OT_copy_material,
@@ -794,8 +964,12 @@ def register():
     bpy.types.Scene.nenoore_settings = PointerProperty(type=NENOORE_Settings)
     bpy.types.Scene.nenoore_portal_coords = CollectionProperty(type=NENOORE_PortalCoord)
     bpy.types.Scene.nenoore_ymap_props = PointerProperty(type=NENOORE_YmapProps)
+    bpy.app.handlers.load_post.append(_clear_dir_cache)
 
 def unregister():
+    if _clear_dir_cache in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_clear_dir_cache)
+    _dir_cache.clear()
     del bpy.types.Scene.nenoore_ymap_props
     del bpy.types.Scene.nenoore_portal_coords
     del bpy.types.Scene.nenoore_settings